@@ -1,14 +1,21 @@
 import os
-import json
-import pprint
+import asyncio
+import inspect
+import queue
+from functools import partial, lru_cache
+from collections import namedtuple
+import threading
+import logging
 from pathlib import Path
-from dotenv import load_dotenv
 
 import tkinter as tk
 from tkinter import messagebox, ttk, Tk
+from tkinter import font as tkfont
 from tkinter.scrolledtext import ScrolledText
 import ctypes
 
+from config_writer import ConfigWriter
+
 # Make the app DPI aware to prevent blurriness on high-resolution screens
 try:
     ctypes.windll.shcore.SetProcessDpiAwareness(True)
@@ -16,17 +23,42 @@ except AttributeError:
     pass # This line is for compatibility with older Windows versions
 
 
-load_dotenv()
+log = logging.getLogger(__name__)
+
+
+# .env is only read once something actually needs the secrets, not at import
+@lru_cache(maxsize=1)
+def _ensure_env():
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+# Named fonts, created once per Tk root; widgets refer to them by name.
+# Module-level references keep Tk from deleting them when they go out of scope.
+TITLE_FONT = None
+SUB_FONT = None
+
+
+def _init_fonts(root):
+    global TITLE_FONT, SUB_FONT
+    if TITLE_FONT is not None:
+        return
+
+    TITLE_FONT = tkfont.Font(root=root, name="PanelTitle", family="Arial", size=16, weight="bold")
+    SUB_FONT = tkfont.Font(root=root, name="PanelSub", family="Arial", size=10)
 
 
 class Screen(object):
     """docstring for Screen"""
+    __slots__ = ("parent", "frame", "header", "body", "_built")
+
     def __init__(self, parent):
         super(Screen, self).__init__()
         self.parent = parent
         self.frame = ttk.Frame(parent)   # <-- actual widget to raise # root
         self.header = None
         self.body = None
+        self._built = False
 
 
     def _screen_header(self, title, subtitle):
@@ -34,8 +66,8 @@ class Screen(object):
         self.header.grid(row=0, column=0, sticky="ew")
         self.header.grid_columnconfigure(0, weight=1)
 
-        ttk.Label(self.header, text=title, font=("Arial", 16, "bold"), anchor="center").grid(row=0, column=0, sticky="ew")
-        ttk.Label(self.header, text=subtitle, font=("Arial", 10), anchor="center").grid(row=1, column=0, sticky="ew", pady=(0, 21))
+        ttk.Label(self.header, text=title, font="PanelTitle", anchor="center").grid(row=0, column=0, sticky="ew")
+        ttk.Label(self.header, text=subtitle, font="PanelSub", anchor="center").grid(row=1, column=0, sticky="ew", pady=(0, 21))
 
         return self.header
 
@@ -57,16 +89,45 @@ class Screen(object):
         self._screen_header(title, subtitle)
         self._screen_body()
 
-        if self.header is None or self.body is None:
-            raise Exception("Header and Body frame incomplete")
+        assert self.header is not None and self.body is not None, "Header and Body frame incomplete"
+
+
+    def _build_body(self):
+        pass
+
+
+    # Body widgets are built the first time the screen is shown, not at setup
+    def ensure_built(self):
+        if self._built:
+            return
+
+        self._built = True
+        self._build_body()
+
+
+    def show(self):
+        self.ensure_built()
+        self.frame.tkraise()
 
 
 class TestsScreen(Screen):
     """docstring for TestScreen"""
+    __slots__ = ("test_log", "run_tests_callback", "_task", "_worker", "_worker_error", "_result_q", "_log_batching", "_line_count")
+    MAX_LOG_LINES = 2000   # oldest lines are dropped past this
+
     def __init__(self, parent, run_tests_callback = None):
         super().__init__(parent)
         self.test_log = None
         self.run_tests_callback = run_tests_callback
+        self._task = None
+
+        # sync callbacks run off the Tk thread; results come back through the queue.
+        # The thread is a daemon so closing the window mid-run doesn't keep the process alive.
+        self._worker = None
+        self._worker_error = None
+        self._result_q = queue.Queue()
+        self._log_batching = False
+        self._line_count = 0
 
 
     def _build_body(self):
@@ -88,26 +149,136 @@ class TestsScreen(Screen):
             .grid(row=0, column=0, sticky="w")
 
 
+    def _insert_line(self, msg: str):
+        # caller guarantees the widget is in "normal" state; msg may hold several lines
+        self.test_log.insert("end", msg + "\n")
+        self._line_count += msg.count("\n") + 1
+        excess = self._line_count - self.MAX_LOG_LINES
+        if excess > 0:
+            self.test_log.delete("1.0", f"{excess + 1}.0")
+            self._line_count -= excess
+
+
     def _append_log(self, msg: str):
+        if self._log_batching:
+            self._insert_line(msg)
+            return
+
         self.test_log.configure(state="normal")
-        self.test_log.insert("end", msg + "\n")
+        self._insert_line(msg)
         self.test_log.yview("end")
         self.test_log.configure(state="disabled")
 
 
-    def run_tests(self):
+    # Keep the log writable for a whole burst of lines instead of toggling per line
+    def _begin_log_batch(self):
+        if self._log_batching:
+            return
+
+        self._log_batching = True
         self.test_log.configure(state="normal")
-        self.test_log.delete("1.0", tk.END)   # clear all text
+
+
+    def _end_log_batch(self):
+        self.test_log.yview("end")
+        self.test_log.after_idle(self._close_log_batch)
+
+
+    def _close_log_batch(self):
+        self._log_batching = False
         self.test_log.configure(state="disabled")
 
+
+    def run_tests(self):
+        # one run at a time, whichever path it took
+        if self._worker is not None and self._worker.is_alive():
+            return
+        if self._task is not None and not self._task.done():
+            return
+
+        self._begin_log_batch()
+        self.test_log.delete("1.0", tk.END)   # clear all text
+        self._line_count = 0
         self._append_log("Starting tests...")
-        
-        tests_results = self.run_tests_callback()
+        self._end_log_batch()
+
+        # async callbacks run on the Panel's asyncio loop so the UI keeps pumping
+        if inspect.iscoroutinefunction(self.run_tests_callback):
+            self._task = asyncio.get_running_loop().create_task(self._run_tests_async())
+            return
+
+        self._worker_error = None
+        self._worker = threading.Thread(target=self._collect_results, name="run-tests", daemon=True)
+        self._worker.start()
+        self._drain_results()
+
+
+    def _collect_results(self):
+        # worker thread: works for list and generator callbacks alike
+        try:
+            tests_results = self.run_tests_callback()
+
+            # already materialized: hand over one block so the log does a single insert
+            if isinstance(tests_results, (list, tuple)):
+                if tests_results:
+                    self._result_q.put("\n".join(map(str, tests_results)))
+                return
+
+            for results in tests_results:
+                self._result_q.put(results)
+        except Exception as e:
+            self._worker_error = e   # reported by _drain_results once the thread is done
+
+
+    def _drain_results(self):
+        done = not self._worker.is_alive()   # checked before draining so no late result is missed
+
+        drained = 0
+        self._begin_log_batch()
+        try:
+            while True:
+                self._append_log(self._result_q.get_nowait())
+                drained += 1
+        except queue.Empty:
+            pass
+
+        if not done:
+            self._end_log_batch()
+            # results are streaming in: come back as soon as Tk has repainted
+            if drained:
+                self.body.after_idle(self._drain_results)
+            else:
+                self.body.after(50, self._drain_results)
+            return
 
-        for results in tests_results:
-            self._append_log(results)
+        if self._worker_error is not None:
+            self._append_log(f"Tests aborted: {self._worker_error}")
+        else:
+            self._append_log("All tests completed.")
+        self._end_log_batch()
 
-        self._append_log("All tests completed.")
+
+    async def _run_tests_async(self):
+        # runs on the loop that pumps Tk, so the log can be written directly
+        lines = []
+        try:
+            tests_results = await self.run_tests_callback()
+
+            if isinstance(tests_results, (list, tuple)):
+                if tests_results:
+                    lines.append("\n".join(map(str, tests_results)))
+            else:
+                for results in tests_results:
+                    lines.append(results)
+        except Exception as e:
+            lines.append(f"Tests aborted: {e}")
+        else:
+            lines.append("All tests completed.")
+
+        self._begin_log_batch()
+        for line in lines:
+            self._append_log(line)
+        self._end_log_batch()
 
 
     def setup(self, title, subtitle):
@@ -115,12 +286,13 @@ class TestsScreen(Screen):
 
         if self.run_tests_callback is None:
             messagebox.showwarning("Warning", "parameters/methods are missing.")
+            self._built = True   # nothing to build without a callback
             return
 
-        self._build_body()
-
 class SecretsScreen(Screen):
     """docstring for TestScreen"""
+    __slots__ = ("apis_config", "api_vars", "_save_config", "save_env")
+
     def __init__(self, parent, _save_config, save_env, apis_config=None):
         super().__init__(parent)
         self.apis_config = apis_config
@@ -151,27 +323,40 @@ class SecretsScreen(Screen):
 
 
     def _build_api_frames(self, content_frame):
+        _ensure_env()
+
+        # bind hot names once; the loop below runs per configured API
+        environ = os.environ
+        StringVar, IntVar = tk.StringVar, tk.IntVar
+        Frame, Label, Entry = ttk.Frame, ttk.Label, ttk.Entry
+        api_vars = self.api_vars
+
         outer_row = 0
         for api_name, values in self.apis_config.items():
-            print(api_name, values, "api")
-            
-            api_frame = ttk.Frame(content_frame)
-            api_frame.grid(row=outer_row, column=0, sticky="ew")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("api %s: %s", api_name, values)
+
+            get = values.get
+            api_key_name = get("api_key", "")
+            enabled = get("enabled", False)
+            base_ep = get("base_endpoint", "")
+
+            api_frame = Frame(content_frame)
             api_frame.grid_columnconfigure(0, weight=0)  # labels
             api_frame.grid_columnconfigure(1, weight=1)  # inputs expand
 
-            checkbox_var = tk.IntVar(value=1 if values.get("enabled", False) else 0)
-            api_secret_var = tk.StringVar( value=os.getenv(values.get("api_key", "")) ) # this way we verify if the right key name is being used across configs or not
-            base_endpoint_var = tk.StringVar( value=values.get("base_endpoint", "") )
+            checkbox_var = IntVar(value=1 if enabled else 0)
+            api_secret_var = StringVar( value=environ.get(api_key_name, "") ) # this way we verify if the right key name is being used across configs or not
+            base_endpoint_var = StringVar( value=base_ep )
 
-            self.api_vars[api_name] = {
+            api_vars[api_name] = {
                 "enabled": checkbox_var,
                 "api_secret": api_secret_var,
                 "base_endpoint": base_endpoint_var,
             }
 
             r = 0
-            ttk.Label(api_frame, text=api_name, font=("Arial", 16, "bold")).grid(row=r, column=0, sticky="ew")
+            Label(api_frame, text=api_name, font="PanelTitle").grid(row=r, column=0, sticky="ew")
 
             checkbox = tk.Checkbutton(api_frame, 
                 text="Enable/Disable", 
@@ -183,15 +368,17 @@ class SecretsScreen(Screen):
             checkbox.grid(row=r, column=1, sticky="e")
 
             r += 1
-            ttk.Label(api_frame, text="API Secret (press alt to view):", font=("Arial", 10)).grid(row=r, column=0, sticky="ew")
-            api_secret_entry = ttk.Entry(api_frame, textvariable=api_secret_var, show="*")
+            Label(api_frame, text="API Secret (press alt to view):", font="PanelSub").grid(row=r, column=0, sticky="ew")
+            api_secret_entry = Entry(api_frame, textvariable=api_secret_var, show="*")
             api_secret_entry.grid(row=r, column=1, sticky="ew")
             self.attach_alt_reveal(api_secret_entry)
 
             r += 1
-            ttk.Label(api_frame, text="Base Endpoint:", font=("Arial", 10)).grid(row=r, column=0, sticky="ew")
-            ttk.Entry(api_frame, textvariable=base_endpoint_var).grid(row=r, column=1, sticky="ew", pady=(6, 12))
+            Label(api_frame, text="Base Endpoint:", font="PanelSub").grid(row=r, column=0, sticky="ew")
+            Entry(api_frame, textvariable=base_endpoint_var).grid(row=r, column=1, sticky="ew", pady=(6, 12))
 
+            # grid the frame only once its children are attached
+            api_frame.grid(row=outer_row, column=0, sticky="ew")
             outer_row += 1
 
 
@@ -200,13 +387,19 @@ class SecretsScreen(Screen):
             messagebox.showwarning("Nothing to save", "No API fields were found.")
             return
 
+        environ = os.environ
         for api_name, vars_ in self.api_vars.items():
-            self.apis_config[api_name] = {
-                "api_key": self.apis_config[api_name]["api_key"],
-                "api_secret": "",
-                "enabled": bool(vars_["enabled"].get()),                 # IntVar.get() -> 0/1
-                "base_endpoint": vars_["base_endpoint"].get().strip(),   # StringVar.get()
-            }
+            # update the existing entry in place
+            entry = self.apis_config[api_name]
+            entry["api_secret"] = ""   # secrets live in the env, never in the config file
+            entry["enabled"] = bool(vars_["enabled"].get())                 # IntVar.get() -> 0/1
+            entry["base_endpoint"] = vars_["base_endpoint"].get().strip()   # StringVar.get()
+
+            # persist an edited secret, including one cleared to empty
+            key_name = entry.get("api_key")
+            secret = vars_["api_secret"].get().strip()
+            if key_name and secret != environ.get(key_name, ""):
+                self.save_env(key_name, secret)
 
         # print("\n", self.apis_config, "updated\n")
         self._save_config()
@@ -238,12 +431,13 @@ class SecretsScreen(Screen):
 
         if self.apis_config is None:
             messagebox.showwarning("Warning", "configs and parameters/methods are missing.")
+            self._built = True
             return
 
-        self._build_body()
-
 class ExchangesScreen(Screen):
     """docstring for ClassName"""
+    __slots__ = ("exchange_config", "stock_vars", "_save_config")
+
     def __init__(self, parent, _save_config, exchange_config=None):
         super().__init__(parent)
         self.exchange_config = exchange_config
@@ -259,37 +453,67 @@ class ExchangesScreen(Screen):
 
         if self.exchange_config is None:
             messagebox.showwarning("Warning", "configs and parameters/methods are missing.")
+            self._built = True
             return
 
-        self._build_body()     
+
+# Flattened per-screen record; Panel keeps one per key instead of the raw screens dicts
+ScreenEntry = namedtuple("ScreenEntry", "title subtitle screen cb")
+
+
+def _default_screen(panel, e):
+    return Screen(panel.content)
 
 
 class Panel(object):
     """docstring for Panel"""
+    __slots__ = ("root", "nav", "content", "_alive", "screens", "config", "save_config", "save_env",
+                 "_entries", "_raise_fns", "_write_config")
+
+    # screen_key -> factory(panel, ScreenEntry); unknown keys fall back to a plain Screen
+    _SCREEN_FACTORIES = {
+        "Tests": lambda self, e: TestsScreen(self.content, e.cb),
+        "Secrets": lambda self, e: SecretsScreen(self.content, self._save_config, self.save_env, apis_config=self.config["apis"]),
+    }
+
     def __init__(self, screens, config, save_config, save_env):
         super(Panel, self).__init__()
         self.root = Tk()
+        _init_fonts(self.root)
         # self.root.tk.call('tk', 'scaling', 2)
 
         self.nav = None
         self.content = None
+        self._alive = False
 
         self.screens = screens
         self.config = config
 
+        # filled from self.screens in setup()
+        self._entries = {}
+        self._raise_fns = {}   # screen_key -> bound Screen.show
+
         # methods
         self.save_config = save_config
         self.save_env = save_env
+        self._write_config = ConfigWriter(save_config)
 
 
     # Function to raise a screen
     def show_screen(self, name):
-        print("show ", name)
-        self.screens[name]["screen"].frame.tkraise()
+        log.debug("show %s", name)
+        self._raise_fns[name]()
 
 
     def _save_config(self):
-        self.save_config(complete_config=json.dumps(self.config, indent=3))
+        self._write_config(self.config)
+
+
+    # Drives Tk from asyncio instead of mainloop(), so async callbacks can await I/O
+    async def _tk_pump(self, interval=1/60):
+        while self._alive:
+            self.root.update()
+            await asyncio.sleep(interval)
 
 
     def _setup_nav(self):
@@ -298,8 +522,9 @@ class Panel(object):
         self.nav.grid(row=0, column=0, sticky="ew")
 
         # Nav buttons
-        for screen_key in self.screens:
-            ttk.Button(self.nav, text=self.screens[screen_key]["title"], command=lambda key=screen_key: self.show_screen(key)).pack(side="left", padx=5)
+        nav, Button, show_screen = self.nav, ttk.Button, self.show_screen
+        for screen_key, e in self._entries.items():
+            Button(nav, text=e.title, command=partial(show_screen, screen_key)).pack(side="left", padx=5)
 
 
     def _setup_content_frame(self):
@@ -309,15 +534,15 @@ class Panel(object):
 
 
     def _setup_screens(self):
-        for screen_key in self.screens:
-            if screen_key == "Tests":
-                self.screens[screen_key]["screen"] = TestsScreen(self.content, self.screens[screen_key]["run_tests_callback"])
-            elif screen_key == "Secrets":
-                self.screens[screen_key]["screen"] = SecretsScreen(self.content, self._save_config, self.save_env, apis_config=self.config["apis"])
-            else:
-                self.screens[screen_key]["screen"] = Screen(self.content)
+        entries = self._entries
+        factories = self._SCREEN_FACTORIES
 
-            self.screens[screen_key]["screen"].setup(self.screens[screen_key]["title"], self.screens[screen_key]["subtitle"])
+        for screen_key, e in entries.items():
+            factory = factories.get(screen_key, _default_screen)
+            scr = factory(self, e)
+            scr.setup(e.title, e.subtitle)
+            entries[screen_key] = e._replace(screen=scr)
+            self._raise_fns[screen_key] = scr.show
 
 
     def setup(self):
@@ -325,6 +550,11 @@ class Panel(object):
             messagebox.showwarning("Warning", "screens and config are missing.")
             return
 
+        self._entries = {
+            k: ScreenEntry(v["title"], v["subtitle"], None, v.get("run_tests_callback"))
+            for k, v in self.screens.items()
+        }
+
         self.root.title("Bot configuration")
         self.root.geometry("900x600")
 
@@ -336,20 +566,22 @@ class Panel(object):
         self._setup_nav()
         self._setup_content_frame()
 
-        if self.nav is None or self.content is None:
-            raise Exception( "Navigation and Content frame incomplete" )
+        assert self.nav is not None and self.content is not None, "Navigation and Content frame incomplete"
 
 
         self._setup_screens()
-        pprint.pprint(self.screens)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("screens=%s", {k: e.title for k, e in self._entries.items()})
 
-        all_screens = self.screens.keys()
-        if len(all_screens) == 0:
-            raise Exception( "Screens setup incomplete" )
+        if not self._entries:
+            raise RuntimeError("Screens setup incomplete")
 
 
         # Show default screen
-        self.show_screen(list(all_screens)[-1])
+        self.show_screen(next(reversed(self._entries)))
 
-        self.root.mainloop()
+        self._alive = True
+        self.root.protocol("WM_DELETE_WINDOW", lambda: setattr(self, "_alive", False))
+        asyncio.run(self._tk_pump())
+        self.root.destroy()
         
@@ -1,13 +1,15 @@
 import re
 import os
 import json
-import pprint
+import logging
 from pathlib import Path
 from dotenv import load_dotenv
 from dataclasses import dataclass
-from typing import Optional, Any, Dict, Tuple, List
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Optional, Any, Dict, Tuple, List, FrozenSet
 
-from PyQt6.QtCore import Qt, QTimeZone, pyqtSignal
+from PyQt6.QtCore import Qt, QEvent, QRegularExpression, QTimeZone, QObject, QTimer, QSignalBlocker, pyqtSignal
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -23,22 +25,49 @@ from PyQt6.QtWidgets import (
     QSplitter,
     QTreeView,
     QInputDialog,
+    QDialog,
+    QDialogButtonBox,
     QVBoxLayout,
     QHBoxLayout,
     QGridLayout,
     QSizePolicy,
     QStackedWidget, QMenu,
-    QFormLayout, QComboBox
+    QFormLayout, QComboBox,
+    QButtonGroup
 )
-from PyQt6.QtGui import QStandardItemModel, QStandardItem, QColor, QBrush
+from PyQt6.QtGui import QStandardItemModel, QStandardItem, QColor, QBrush, QFont, QRegularExpressionValidator, QTextCursor
+
+from config_writer import ConfigWriter
 
 ROLE_KEY = int(Qt.ItemDataRole.UserRole) + 1
+ROLE_FG = int(Qt.ItemDataRole.ForegroundRole)
+EMPTY = MappingProxyType({})   # shared read-only default for config lookups
 DISABLED_BRUSH = QBrush(QColor("#9aa0a6"))
+API_NAME_RE = re.compile(r"[A-Za-z0-9_]+")
+
+# enum members resolved once; compared on every event the secret fields receive
+EV_KEY_PRESS = QEvent.Type.KeyPress
+EV_KEY_RELEASE = QEvent.Type.KeyRelease
+EV_FOCUS_OUT = QEvent.Type.FocusOut
+KEY_ALT = Qt.Key.Key_Alt
+ECHO_NORMAL = QLineEdit.EchoMode.Normal
+ECHO_PASSWORD = QLineEdit.EchoMode.Password
 
 
 
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
+
+# Shared label fonts, built on first use (a QFont needs the QApplication to exist)
+@lru_cache(maxsize=None)
+def _font(point_size: int, bold: bool = False) -> QFont:
+    f = QFont()
+    f.setPointSize(point_size)
+    f.setBold(bold)
+    return f
+
 
 
 class Screen(object):
@@ -64,16 +93,11 @@ class Screen(object):
         hl.setSpacing(6)
 
         title_lbl = QLabel(title, header)
-        f = title_lbl.font()
-        f.setPointSize(14)
-        f.setBold(True)
-        title_lbl.setFont(f)
+        title_lbl.setFont(_font(14, bold=True))
         title_lbl.setAlignment(Qt.AlignmentFlag.AlignHCenter)
 
         sub_lbl = QLabel(subtitle, header)
-        subf = sub_lbl.font()
-        subf.setPointSize(9)
-        sub_lbl.setFont(subf)
+        sub_lbl.setFont(_font(9))
         sub_lbl.setAlignment(Qt.AlignmentFlag.AlignHCenter)
 
         hl.addWidget(title_lbl)
@@ -91,20 +115,16 @@ class Screen(object):
         self.frame_layout.addWidget(self.body, 1)
         return self.body
 
-    def _apply_enabled_style(self, item, enabled: bool):
-        # Keep selectable; only change appearance.
-        color = QColor("#fff") if enabled else QColor("#9aa0a6")
-        item.setForeground(0, QBrush(color))  # gray-out via foreground role 
-
     def setup(self, title: str, subtitle: str):
         self._screen_header(title, subtitle)
         self._screen_body()
 
-        if self.header is None or self.body is None:
-            raise Exception("Header and Body widget incomplete")
+        assert self.header is not None and self.body is not None, "Header and Body widget incomplete"
 
 
 class TestsScreen(Screen):
+    MAX_LOG_BLOCKS = 5000
+
     def __init__(self, parent, run_tests_callback=None):
         super().__init__(parent)
         self.test_log = None
@@ -117,6 +137,10 @@ class TestsScreen(Screen):
 
         self.test_log = QPlainTextEdit(self.body)
         self.test_log.setReadOnly(True)
+        # bounded document: Qt drops the oldest blocks instead of growing forever
+        self.test_log.setMaximumBlockCount(self.MAX_LOG_BLOCKS)
+        # read-only log: nothing to undo, so don't keep an undo history of every write
+        self.test_log.setUndoRedoEnabled(False)
         layout.addWidget(self.test_log, 1)
 
         btn_row = QHBoxLayout()
@@ -127,23 +151,20 @@ class TestsScreen(Screen):
 
         layout.addLayout(btn_row)
 
-    def _append_log(self, msg: str):
-        self.test_log.appendPlainText(msg)
-        self.test_log.verticalScrollBar().setValue(self.test_log.verticalScrollBar().maximum())
-
     def run_tests(self):
-        self.test_log.clear()
-        self._append_log("Starting tests...")
-
         if self.run_tests_callback is None:
-            self._append_log("No test callback configured.")
+            self.test_log.setPlainText("Starting tests...\nNo test callback configured.")
             return
 
-        tests_results = self.run_tests_callback()
-        for results in tests_results:
-            self._append_log(str(results))
+        # collect everything first, then replace the document in one go
+        lines = ["Starting tests..."]
+        lines.extend(str(results) for results in self.run_tests_callback())
+        lines.append("All tests completed.")
 
-        self._append_log("All tests completed.")
+        self.test_log.setUpdatesEnabled(False)
+        self.test_log.setPlainText("\n".join(lines))
+        self.test_log.moveCursor(QTextCursor.MoveOperation.End)
+        self.test_log.setUpdatesEnabled(True)
 
     def setup(self, title, subtitle):
         super().setup(title, subtitle)
@@ -165,33 +186,65 @@ class APIScreen(Screen):
         self.save_env = save_env
 
         # State for dynamic UI
-        self.api_vars = {}          # api_name -> {"enabled":..., "api_secret":..., "base_endpoint":..., "card":...}
+        # realized cards, one dict per field: api_name -> widget
+        self._cards: Dict[str, QFrame] = {}
+        self._enabled_cb: Dict[str, QCheckBox] = {}
+        self._endpoint_le: Dict[str, QLineEdit] = {}
+        self._dirty = set()         # api names edited, added or deleted since the last save
+        # unsaved edits of recycled cards: api_name -> {"enabled", "base_endpoint"};
+        # merged into apis_config only by _save
+        self._stashed: Dict[str, dict] = {}
 
         self.scroll_area = None
         self.inner_widget = None
         self.inner_layout = None
+        self._add_dialog: Optional[QDialog] = None
+        self._add_edit: Optional[QLineEdit] = None
+
+        # parented to the frame so it lives as long as the cards it watches
+        self._alt_filter = self._AltRevealFilter(self.frame)
+
+        # api_name -> fixed-height stand-in; real cards are built once scrolled into view
+        self._placeholders = {}
+
+        # every card's Delete button joins this group; the button carries its api_name
+        self._delete_group = QButtonGroup(self.frame)
+        self._delete_group.buttonClicked.connect(self._on_delete_clicked)
 
     # ---- Alt reveal logic (same idea as before) ----
-    class _AltRevealFilter(QWidget):
-        def __init__(self, line_edit: QLineEdit):
-            super().__init__()
-            self.line_edit = line_edit
+    # One filter instance serves every secret field; it acts on whichever line edit sent the event.
+    class _AltRevealFilter(QObject):
+        # installed only on the secret QLineEdits; every other event type leaves after one type() call
+        def eventFilter(self, obj, event):
+            t = event.type()
+            if t == EV_FOCUS_OUT:
+                obj.setEchoMode(ECHO_PASSWORD)
+            elif t == EV_KEY_PRESS:
+                if event.key() == KEY_ALT and obj.hasFocus():
+                    obj.setEchoMode(ECHO_NORMAL)
+            elif t == EV_KEY_RELEASE:
+                if event.key() == KEY_ALT:
+                    obj.setEchoMode(ECHO_PASSWORD)
+            return False
+
+    # Calls back whenever the scroll viewport is shown or resized
+    class _ViewportWatcher(QObject):
+        def __init__(self, parent, callback):
+            super().__init__(parent)
+            self._callback = callback
 
         def eventFilter(self, obj, event):
-            if obj is self.line_edit:
-                if event.type() == event.Type.KeyPress and event.key() == Qt.Key.Key_Alt:
-                    if self.line_edit.hasFocus():
-                        self.line_edit.setEchoMode(QLineEdit.EchoMode.Normal)
-                elif event.type() == event.Type.KeyRelease and event.key() == Qt.Key.Key_Alt:
-                    self.line_edit.setEchoMode(QLineEdit.EchoMode.Password)
-                elif event.type() == event.Type.FocusOut:
-                    self.line_edit.setEchoMode(QLineEdit.EchoMode.Password)
+            if event.type() in (event.Type.Resize, event.Type.Show):
+                self._callback()
             return False
 
+    CARD_HEIGHT_HINT = 120   # placeholder height, roughly one card
+    RECYCLE_DISTANCE = 10 * CARD_HEIGHT_HINT   # cards further than this from the viewport are dropped
+
     def _build_body(self):
         """
         Build scroll area ONCE.
-        Add all existing API cards into the inner layout.
+        Add a placeholder per existing API; cards are realized as they scroll into view.
         """
         layout = QVBoxLayout(self.body)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -210,13 +263,21 @@ class APIScreen(Screen):
         self.scroll_area.setWidget(self.inner_widget)
         layout.addWidget(self.scroll_area, 1)
 
-        # Add existing APIs as cards (fast, no canvas hacks)
-        if self.apis_config:
-            for api_name, values in self.apis_config.items():
-                self._add_api_card(api_name, values)
+        # Reserve space for existing APIs; _realize_visible swaps in real cards.
+        # The screen isn't shown yet, so Qt lays these out once on the next loop pass.
+        for api_name in self.apis_config:
+            ph = QWidget(self.inner_widget)
+            ph.setFixedHeight(self.CARD_HEIGHT_HINT)
+            self.inner_layout.addWidget(ph)
+            self._placeholders[api_name] = ph
 
         self.inner_layout.addStretch(1)
 
+        vbar = self.scroll_area.verticalScrollBar()
+        vbar.valueChanged.connect(self._realize_visible)
+        vbar.rangeChanged.connect(self._realize_visible)
+        self.scroll_area.viewport().installEventFilter(self._ViewportWatcher(self.scroll_area, self._realize_visible))
+
         # Bottom bar once
         bottom = QHBoxLayout()
         add_btn = QPushButton("Add", self.body)
@@ -230,10 +291,72 @@ class APIScreen(Screen):
         bottom.addWidget(save_btn)
         layout.addLayout(bottom)
 
-    def _add_api_card(self, api_name: str, values: dict):
+    def _realize_visible(self, *_):
+        if self.scroll_area is None:
+            return
+
+        env = os.environ   # looked up once for every card realized in this pass
+
+        # visible band plus one card of look-ahead
+        top = self.scroll_area.verticalScrollBar().value()
+        bottom = top + self.scroll_area.viewport().height() + self.CARD_HEIGHT_HINT
+
+        realized = set()
+        for api_name, ph in list(self._placeholders.items()):
+            if ph.y() + ph.height() < top or ph.y() > bottom:
+                continue
+            if self._placeholders.pop(api_name, None) is None:
+                continue   # already realized by a nested call
+
+            index = self.inner_layout.indexOf(ph)
+            self.inner_layout.removeWidget(ph)
+            ph.deleteLater()
+            values = self.apis_config[api_name]
+            stashed = self._stashed.pop(api_name, None)
+            if stashed is not None:
+                values = {**values, **stashed}   # the rebuilt card carries the unsaved edits again
+            self._add_api_card(api_name, values, index=index, env=env)
+            realized.add(api_name)
+
+        self._recycle_far_cards(top - self.RECYCLE_DISTANCE, bottom + self.RECYCLE_DISTANCE, skip=realized)
+
+    def _recycle_far_cards(self, keep_top: int, keep_bottom: int, skip=()):
+        """
+        Turn cards far outside [keep_top, keep_bottom] back into placeholders so only
+        the cards around the viewport hold widgets. Unsaved edits are kept in _stashed.
+        """
+        focus = QApplication.focusWidget()
+
+        for api_name, card in list(self._cards.items()):
+            if api_name in skip or card.isAncestorOf(focus):
+                continue
+            if keep_top <= card.y() + card.height() and card.y() <= keep_bottom:
+                continue
+
+            # stash the card's state on the screen, not in the shared config: the panel
+            # may write apis_config for another screen's save before this one is saved
+            enabled_cb = self._enabled_cb.pop(api_name)
+            endpoint_le = self._endpoint_le.pop(api_name)
+            if api_name in self._dirty:
+                self._stashed[api_name] = {
+                    "enabled": bool(enabled_cb.isChecked()),
+                    "base_endpoint": endpoint_le.text().strip(),
+                }
+
+            ph = QWidget(self.inner_widget)
+            ph.setFixedHeight(card.height())   # same height, so the scroll position holds
+            self.inner_layout.insertWidget(self.inner_layout.indexOf(card), ph)
+            self._placeholders[api_name] = ph
+
+            del self._cards[api_name]
+            self.inner_layout.removeWidget(card)
+            card.deleteLater()
+
+    def _add_api_card(self, api_name: str, values: dict, index: Optional[int] = None, env=None):
         # MOVE IT TO FORM LAYOUT
         """
-        Create ONE API card widget and insert it into the scroll area's inner layout.
+        Create ONE API card widget and insert it into the scroll area's inner layout,
+        at index (a placeholder's slot) or above the trailing stretch.
         """
         card = QFrame(self.inner_widget)
         card.setFrameShape(QFrame.Shape.StyledPanel)
@@ -244,27 +367,31 @@ class APIScreen(Screen):
         grid.setVerticalSpacing(8)
 
         title_lbl = QLabel(api_name, card)
-        f = title_lbl.font()
-        f.setPointSize(14)
-        f.setBold(True)
-        title_lbl.setFont(f)
+        title_lbl.setFont(_font(14, bold=True))
 
         enabled_cb = QCheckBox("Enable/Disable", card)
         enabled_cb.setChecked(bool(values.get("enabled", False)))
 
+        if env is None:
+            env = os.environ
         env_key_name = values.get("api_key", "")
-        api_secret = os.getenv(env_key_name, "")
+        api_secret = env.get(env_key_name, "")
         api_secret_entry = QLineEdit(card)
         api_secret_entry.setText(api_secret)
         # api_secret_entry.setEchoMode(QLineEdit.EchoMode.Password)
         api_secret_entry.setReadOnly(True)
-        api_secret_entry.installEventFilter(self._AltRevealFilter(api_secret_entry))
+        api_secret_entry.installEventFilter(self._alt_filter)
 
         base_endpoint_entry = QLineEdit(card)
         base_endpoint_entry.setText(values.get("base_endpoint", ""))
 
+        # connected after the initial values so only user edits mark the card dirty
+        enabled_cb.toggled.connect(partial(self._mark_dirty, api_name))
+        base_endpoint_entry.textEdited.connect(partial(self._mark_dirty, api_name))
+
         delete_btn = QPushButton("Delete", card)
-        delete_btn.clicked.connect(lambda _=False, name=api_name: self._delete(name))
+        delete_btn.setProperty("api_name", api_name)
+        self._delete_group.addButton(delete_btn)
 
         r = 0
         grid.addWidget(title_lbl, r, 0)
@@ -280,78 +407,122 @@ class APIScreen(Screen):
         grid.addWidget(base_endpoint_entry, r, 1, 1, 2)
 
         # Store references for _save() and _delete()
-        self.api_vars[api_name] = {
-            "enabled": enabled_cb,
-            "api_secret": api_secret_entry,
-            "base_endpoint": base_endpoint_entry,
-            "card": card,
-        }
+        self._cards[api_name] = card
+        self._enabled_cb[api_name] = enabled_cb
+        self._endpoint_le[api_name] = base_endpoint_entry
 
-        # Insert above the stretch (stretch is last item)
-        insert_at = max(0, self.inner_layout.count() - 1)
+        # Insert above the stretch (stretch is last item) unless a slot was given
+        insert_at = index if index is not None else max(0, self.inner_layout.count() - 1)
         self.inner_layout.insertWidget(insert_at, card)
 
+    def _name_dialog(self) -> QDialog:
+        # built on first Add and reused; the validator stops invalid characters being typed
+        # and OK stays disabled until the name is acceptable
+        if self._add_dialog is None:
+            dlg = QDialog(self.frame)
+            dlg.setWindowTitle("Input")
+            lay = QVBoxLayout(dlg)
+            lay.addWidget(QLabel("API name (letters, digits, _)", dlg))
+
+            edit = QLineEdit(dlg)
+            edit.setValidator(QRegularExpressionValidator(QRegularExpression(API_NAME_RE.pattern), edit))
+            lay.addWidget(edit)
+
+            buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel, dlg)
+            ok_btn = buttons.button(QDialogButtonBox.StandardButton.Ok)
+            ok_btn.setEnabled(False)
+            edit.textChanged.connect(lambda _text: ok_btn.setEnabled(edit.hasAcceptableInput()))
+            buttons.accepted.connect(dlg.accept)
+            buttons.rejected.connect(dlg.reject)
+            lay.addWidget(buttons)
+
+            self._add_dialog = dlg
+            self._add_edit = edit
+        return self._add_dialog
+
     def _add(self):
-        name, ok = QInputDialog.getText(self.frame, "Input", "API name")
-        if not ok or not name.strip():
+        dlg = self._name_dialog()
+        self._add_edit.clear()
+        self._add_edit.setFocus()
+        if not dlg.exec():
             return
 
-        api_name = name.strip()
+        # the validator only accepts [A-Za-z0-9_]+, so there is nothing left to check here
+        api_name = self._add_edit.text()
         if api_name in self.apis_config:
             QMessageBox.warning(self.frame, "Exists", f"'{api_name}' already exists.")
             return
 
-        # Only A-Z, a-z, 0-9, _
-        if not re.fullmatch(r"[A-Za-z0-9_]+", api_name):
-            QMessageBox.warning(
-                self.frame,
-                "Invalid name",
-                "Use only letters, digits, and underscore (_). No spaces or other characters.",
-            )
-            return
-
         # You must decide defaults; keeping config structure the same.
         # Using API_KEY_NAME placeholder so you can edit config later.
         self.apis_config[api_name] = {
-            "api_key": f"{api_name.upper().replace(' ', '_')}_API_KEY",
+            "api_key": f"{api_name.upper()}_API_KEY",
             "api_secret": "",
             "enabled": True,
             "base_endpoint": "",
         }
 
         self._add_api_card(api_name, self.apis_config[api_name])
+        self._mark_dirty(api_name)
         self._save()
 
+    def _mark_dirty(self, api_name: str, *_):
+        self._dirty.add(api_name)
+
+    def _on_delete_clicked(self, btn):
+        self._delete(btn.property("api_name"))
+
     def _delete(self, api_name: str):
         reply = QMessageBox.question(self.frame, "Confirm delete", f"Delete '{api_name}'?")
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        entry = self.api_vars.pop(api_name, None)
-        if entry and entry.get("card"):
-            entry["card"].setParent(None)
-            entry["card"].deleteLater()
+        self._enabled_cb.pop(api_name, None)
+        self._endpoint_le.pop(api_name, None)
+        self._stashed.pop(api_name, None)
+        card = self._cards.pop(api_name, None)
+        if card is not None:
+            # destruction also takes it out of inner_layout: one relayout on the next loop pass
+            card.deleteLater()
 
         self.apis_config.pop(api_name, None)
+        self._mark_dirty(api_name)
 
-        # Save immediately
+        # the panel coalesces the actual file write
         self._save()
 
     def _save(self):
-        if not self.api_vars:
+        # cards never realized have no edits; recycled ones left theirs in _stashed
+        if not self._dirty and not self._cards and not self._placeholders:
             QMessageBox.warning(self.frame, "Nothing to save", "No API fields were found.")
             return
 
-        for api_name, vars_ in self.api_vars.items():
+        # only cards touched since the last save are rewritten, from their widgets
+        # or, for recycled cards, from the stash; deleted ones have neither
+        dirty, self._dirty = self._dirty, set()
+        for api_name in dirty:
+            cb = self._enabled_cb.get(api_name)
+            if cb is not None:
+                values = {
+                    "enabled": bool(cb.isChecked()),
+                    "base_endpoint": self._endpoint_le[api_name].text().strip(),
+                }
+            else:
+                values = self._stashed.pop(api_name, None)
+                if values is None:
+                    continue
             self.apis_config[api_name] = {
                 "api_key": self.apis_config[api_name]["api_key"],
                 "api_secret": "",  # unchanged behavior
-                "enabled": bool(vars_["enabled"].isChecked()),
-                "base_endpoint": vars_["base_endpoint"].text().strip(),
+                **values,
             }
 
+        if not dirty:
+            QMessageBox.information(self.frame, "Nothing to save", "No API changes since the last save.")
+            return
+
         self._save_config()
-        QMessageBox.information(self.frame, "Saved", "Config Updated!")
+        QMessageBox.information(self.frame, "Updated", "Config updated; it will be written to disk shortly.")
 
     def setup(self, title, subtitle):
         super().setup(title, subtitle)
@@ -364,7 +535,7 @@ class APIScreen(Screen):
 # ----------------------
 # Stable node identity (no QModelIndex storage)
 # -----------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NodeKey:
     kind: str                 # "ex" | "st" | "grp_news" | "grp_social" | "grp_fin" | "src_news" | "src_social" | "src_fin"
     ex: Optional[str] = None
@@ -555,6 +726,14 @@ class ExchangeConfigFacade:
 # Always render the group nodes even when empty.
 # -----------------------------
 class ExchangeTreeModelBuilder:
+    # (group label, stock cfg key, group kind, source kind), in display order
+    SOURCE_GROUPS = (
+        ("Social sources", "social_sources", "grp_social", "src_social"),
+        ("News sources", "news_sources", "grp_news", "src_news"),
+        ("Financial sources", "financial_sources", "grp_fin", "src_fin"),
+    )
+    _GROUP_SPEC = {spec[2]: spec for spec in SOURCE_GROUPS}
+
     def __init__(self, facade: ExchangeConfigFacade):
         self.f = facade
 
@@ -562,49 +741,203 @@ class ExchangeTreeModelBuilder:
         model = QStandardItemModel()
         model.setHorizontalHeaderLabels(["Exchanges"])
 
-        root = model.invisibleRootItem()
-        exchanges = self.f.exchange_config or {}
+        exchanges = self.f.exchange_config or EMPTY
 
+        # build detached rows first, then attach each level with one appendRows
+        # effective state is resolved once per level and passed down, not re-derived per node
+        ex_items = []
         for ex_key in sorted(exchanges.keys()):
-            ex_item = self._mk_item(self.f.ex_label(ex_key), NodeKey("ex", ex=ex_key))
-            root.appendRow(ex_item)
+            ex_ok = self.f.ex_enabled(ex_key)
+            ex_item = self._mk_item(self.f.ex_label(ex_key), NodeKey("ex", ex=ex_key), ex_ok)
+            ex_items.append(ex_item)
 
-            stocks = (self.f.ex(ex_key).get("stocks", {}) or {})
-            for ticker_key in sorted(stocks.keys()):
-                st_item = self._mk_item(self.f.stock_label(ex_key, ticker_key), NodeKey("st", ex=ex_key, ticker=ticker_key))
-                ex_item.appendRow(st_item)
+            # disabled exchanges stay collapsed; their stocks are built on expand
+            if not ex_ok:
+                ex_item.appendRow(self._placeholder())
+                continue
 
-                # Always create all groups (even if empty)
-                grp_social = self._mk_item("Social sources", NodeKey("grp_social", ex=ex_key, ticker=ticker_key))
-                st_item.appendRow(grp_social)
+            self._fill_exchange(ex_item, ex_key, ex_ok)
 
-                grp_news = self._mk_item("News sources", NodeKey("grp_news", ex=ex_key, ticker=ticker_key))
-                st_item.appendRow(grp_news)
+        model.invisibleRootItem().appendRows(ex_items)
+        return model
 
-                grp_fin = self._mk_item("Financial sources", NodeKey("grp_fin", ex=ex_key, ticker=ticker_key))
-                st_item.appendRow(grp_fin)
+    def _fill_exchange(self, ex_item: QStandardItem, ex_key: str, ex_ok: bool):
+        stocks = self.f.ex(ex_key).get("stocks") or EMPTY
+        st_items = []
+        for ticker_key in sorted(stocks.keys()):
+            st_ok = ex_ok and bool(stocks[ticker_key].get("enabled", True))
+            st_item = self._mk_item(self.f.stock_label(ex_key, ticker_key), NodeKey("st", ex=ex_key, ticker=ticker_key), st_ok)
+            # groups/sources are built on first expand (see populate)
+            st_item.appendRow(self._placeholder())
+            st_items.append(st_item)
 
-                # Fill group children (if any)
-                social = self.f.social_map(ex_key, ticker_key)
-                for src_name in sorted(social.keys()):
-                    grp_social.appendRow(self._mk_item(src_name, NodeKey("src_social", ex=ex_key, ticker=ticker_key, name=src_name)))
+        ex_item.appendRows(st_items)
 
-                news = self.f.news_list(ex_key, ticker_key)
-                for idx in range(len(news)):
-                    grp_news.appendRow(self._mk_item(self.f.news_label(ex_key, ticker_key, idx), NodeKey("src_news", ex=ex_key, ticker=ticker_key, idx=idx)))
+    # ---- lazy children ----
+    @staticmethod
+    def _placeholder() -> QStandardItem:
+        # keyless child: gives the parent an expand arrow until populated
+        it = QStandardItem("")
+        it.setEditable(False)
+        return it
 
-                fin = self.f.fin_map(ex_key, ticker_key)
-                for src_name in sorted(fin.keys()):
-                    grp_fin.appendRow(self._mk_item(src_name, NodeKey("src_fin", ex=ex_key, ticker=ticker_key, name=src_name)))
+    @staticmethod
+    def is_pending(item: QStandardItem) -> bool:
+        return item.rowCount() == 1 and item.child(0).data(ROLE_KEY) is None
 
-        return model
+    def populate(self, item: QStandardItem) -> bool:
+        """Swap a pending placeholder under item for its real children."""
+        if not self.is_pending(item):
+            return False
+
+        key = item.data(ROLE_KEY)
+        item.removeRow(0)
+        if not isinstance(key, NodeKey):
+            return True
+
+        if key.kind == "ex":
+            self._fill_exchange(item, key.ex or "", self.f.ex_enabled(key.ex or ""))
+        elif key.kind == "st":
+            self._fill_stock(item, key.ex or "", key.ticker or "")
+        return True
+
+    def _fill_stock(self, st_item: QStandardItem, ex_key: str, ticker_key: str):
+        stock = self.f.stock(ex_key, ticker_key)
+        st_ok = self.f.stock_effective_enabled(ex_key, ticker_key)
+
+        # Always create all groups (even if empty), filled before they go into the live model
+        groups = []
+        for label, _cfg_key, grp_kind, _src_kind in self.SOURCE_GROUPS:
+            grp_key = NodeKey(grp_kind, ex=ex_key, ticker=ticker_key)
+            grp = self._mk_item(label, grp_key, st_ok)
+            grp.appendRows(self._source_items(grp_key, stock, st_ok))
+            groups.append(grp)
+
+        st_item.appendRows(groups)
+
+    def _source_items(self, grp_key: NodeKey, stock: dict, st_ok: bool) -> List[QStandardItem]:
+        ex_key, ticker_key = grp_key.ex or "", grp_key.ticker or ""
+        _label, cfg_key, _grp_kind, src_kind = self._GROUP_SPEC[grp_key.kind]
+        container = stock.get(cfg_key) or EMPTY
+
+        # news is a list addressed by index; the other groups are name -> cfg maps
+        if src_kind == "src_news":
+            rows = (
+                (self.f.news_label(ex_key, ticker_key, idx), NodeKey(src_kind, ex=ex_key, ticker=ticker_key, idx=idx), src)
+                for idx, src in enumerate(container)
+            )
+        else:
+            rows = (
+                (name, NodeKey(src_kind, ex=ex_key, ticker=ticker_key, name=name), container[name])
+                for name in sorted(container)
+            )
+
+        return [
+            self._mk_item(text, key, st_ok and bool((cfg or EMPTY).get("enabled", True)))
+            for text, key, cfg in rows
+        ]
+
+    def reload_group(self, grp_item: QStandardItem):
+        """Replace a group's source rows from config (re-indexes news after a delete)."""
+        grp_key = grp_item.data(ROLE_KEY)
+        ex_key, ticker_key = grp_key.ex or "", grp_key.ticker or ""
+        st_ok = self.f.stock_effective_enabled(ex_key, ticker_key)
+        grp_item.removeRows(0, grp_item.rowCount())
+        grp_item.appendRows(self._source_items(grp_key, self.f.stock(ex_key, ticker_key), st_ok))
+
+    # ---- in-place refresh (after an editor save) ----
+    def _label(self, key: NodeKey) -> Optional[str]:
+        if key.kind == "ex":
+            return self.f.ex_label(key.ex or "")
+        if key.kind == "st":
+            return self.f.stock_label(key.ex or "", key.ticker or "")
+        if key.kind == "src_news":
+            return self.f.news_label(key.ex or "", key.ticker or "", key.idx if key.idx is not None else -1)
+        if key.kind in ("src_social", "src_fin"):
+            return key.name
+        return None
+
+    def refresh(self, item: QStandardItem):
+        """Re-read label + enabled state for item and restyle its built subtree."""
+        key = item.data(ROLE_KEY)
+        if not isinstance(key, NodeKey):
+            return
+
+        label = self._label(key)
+        if label is not None and item.text() != label:
+            item.setText(label)
+
+        enabled = self.f.node_effective_enabled(key)
+        was_enabled = item.data(ROLE_FG) is None
+        self._style(item, enabled)
+
+        # a save only touches the node's own cfg: if its effective state held
+        # (e.g. just a rename), nothing below it can have changed either
+        if enabled == was_enabled:
+            return
+
+        if key.kind == "ex":
+            ex_key = key.ex or ""
+            stocks = self.f.ex(ex_key).get("stocks") or EMPTY
+            for row in range(item.rowCount()):
+                st_item = item.child(row)
+                st_key = st_item.data(ROLE_KEY)
+                if not isinstance(st_key, NodeKey):
+                    continue  # still pending
+                st_cfg = stocks.get(st_key.ticker or "") or EMPTY
+                st_ok = enabled and bool(st_cfg.get("enabled", True))
+                self._style(st_item, st_ok)
+                self._restyle_stock(st_item, st_cfg, st_ok)
+        elif key.kind == "st":
+            self._restyle_stock(item, self.f.stock(key.ex or "", key.ticker or ""), enabled)
+
+    def _restyle_stock(self, st_item: QStandardItem, stock: dict, st_ok: bool):
+        style = self._style
+        # hoisted once per stock rather than per group/source
+        containers = {src_kind: stock.get(cfg_key) or EMPTY for _l, cfg_key, _g, src_kind in self.SOURCE_GROUPS}
+        news = containers["src_news"]
+        nlen = len(news)
+
+        for g in range(st_item.rowCount()):
+            grp = st_item.child(g)
+            grp_key = grp.data(ROLE_KEY)
+            if grp_key is None:
+                continue  # still pending
+            style(grp, st_ok)
+
+            child = grp.child
+            n = grp.rowCount()
+            if not st_ok:
+                # a disabled stock disables everything under it; skip the cfg reads
+                for c in range(n):
+                    style(child(c), False)
+                continue
+
+            if grp_key.kind == "grp_news":
+                for c in range(n):
+                    src = child(c)
+                    idx = src.data(ROLE_KEY).idx
+                    cfg = news[idx] if idx is not None and 0 <= idx < nlen else EMPTY
+                    style(src, bool(cfg.get("enabled", True)))
+            else:
+                get = containers[self._GROUP_SPEC[grp_key.kind][3]].get
+                for c in range(n):
+                    src = child(c)
+                    cfg = get(src.data(ROLE_KEY).name or "") or EMPTY
+                    style(src, bool(cfg.get("enabled", True)))
+
+    @staticmethod
+    def _style(item: QStandardItem, enabled: bool):
+        # enabled rows carry no foreground; skip the setData (and its dataChanged) when nothing changes
+        if (item.data(ROLE_FG) is None) == enabled:
+            return
+        item.setData(None if enabled else DISABLED_BRUSH, ROLE_FG)
 
-    def _mk_item(self, text: str, key: NodeKey) -> QStandardItem:
+    def _mk_item(self, text: str, key: NodeKey, enabled: bool) -> QStandardItem:
         it = QStandardItem(text)
         it.setEditable(False)
         it.setData(key, ROLE_KEY)
-        enabled = self.f.node_effective_enabled(key)
-        it.setData(None if enabled else DISABLED_BRUSH, int(Qt.ItemDataRole.ForegroundRole))
+        self._style(it, enabled)
         return it
 
 # -----------------------------
@@ -619,6 +952,7 @@ class ExchangeTreePanel(QWidget):
         self.f = facade
         self.view = QTreeView(self)
         self.view.setHeaderHidden(True)
+        self.view.setUniformRowHeights(True)
 
         lay = QVBoxLayout(self)
         lay.setContentsMargins(0, 0, 0, 0)
@@ -631,12 +965,51 @@ class ExchangeTreePanel(QWidget):
         self.view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.view.customContextMenuRequested.connect(self._on_context_menu)
 
+        # stock subtrees are filled in lazily when expanded
+        self.view.expanded.connect(self._on_expanded)
+
+        # restyles requested by editor saves, flushed together on the next loop pass
+        self._pending_refresh: Dict[NodeKey, None] = {}
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._flush_refresh)
+
+        # keyboard current-row changes, coalesced before nodeSelected goes out
+        self._pending_key: Optional[NodeKey] = None
+        self._select_now = False    # set while select() moves the current row
+        self._select_timer = QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(80)
+        self._select_timer.timeout.connect(self._emit_selected)
+
         self.rebuild(select_key=None)
 
     def rebuild(self, select_key: Optional[NodeKey]):
-        self.model = self._builder.build()
-        self.view.setModel(self.model)
-        self.view.expandToDepth(0)
+        # a key queued against the old model may no longer exist
+        self._select_timer.stop()
+        self._pending_key = None
+
+        # the whole item tree is built detached, before the view sees it
+        model = self._builder.build()
+        old_sel = self.view.selectionModel()
+
+        # one repaint for the model swap + initial expansion
+        self.view.setUpdatesEnabled(False)
+        self.view.setModel(model)
+        # setModel() doesn't delete the previous selection model; drop the old
+        # model only after the swap so the view never resets onto an empty one
+        if old_sel is not None:
+            old_sel.deleteLater()
+        self.model = model
+
+        # expand exchanges whose stocks are already built (i.e. the enabled ones)
+        root = self.model.invisibleRootItem()
+        for row in range(root.rowCount()):
+            ex_item = root.child(row)
+            if not self._builder.is_pending(ex_item):
+                self.view.expand(ex_item.index())
+        self.view.setUpdatesEnabled(True)
 
         # Reconnect because selectionModel changes with the model
         self.view.selectionModel().currentChanged.connect(self._on_current_changed)
@@ -644,30 +1017,134 @@ class ExchangeTreePanel(QWidget):
         if select_key:
             self.select(select_key)
 
+    def _find(self, key: NodeKey):
+        # walk down key's ancestry, scanning only one sibling list per level,
+        # instead of a recursive match() over every row in the model
+        chain = [key]
+        k = key.parent_key()
+        while k is not None:
+            chain.append(k)
+            k = k.parent_key()
+
+        item = self.model.invisibleRootItem()
+        for k in reversed(chain):
+            child = item.child
+            for row in range(item.rowCount()):
+                if child(row).data(ROLE_KEY) == k:
+                    item = child(row)
+                    break
+            else:
+                return None
+        return item.index()
+
+    def _ensure_loaded(self, key: NodeKey):
+        # populate every lazy ancestor so the node itself exists in the model
+        ancestors = []
+        k = key.parent_key()
+        while k is not None:
+            ancestors.append(k)
+            k = k.parent_key()
+
+        for anc in reversed(ancestors):
+            idx = self._find(anc)
+            if idx is None:
+                return
+            self._builder.populate(self.model.itemFromIndex(idx))
+
+    def refresh(self, *keys: NodeKey) -> bool:
+        """Restyle each key's row and subtree in place; False if any isn't in the model."""
+        if not self.model:
+            return False
+
+        found = True
+        # a restyle can touch every built row under an exchange; paint once at the end
+        self.view.setUpdatesEnabled(False)
+        try:
+            for key in keys:
+                idx = self._find(key)
+                if idx is None:
+                    found = False
+                    continue
+                self._builder.refresh(self.model.itemFromIndex(idx))
+        finally:
+            self.view.setUpdatesEnabled(True)
+        return found
+
+    def schedule_refresh(self, key: NodeKey):
+        # coalesced: every key queued before the next loop pass is restyled in one batch
+        self._pending_refresh[key] = None
+        self._refresh_timer.start()
+
+    def _flush_refresh(self):
+        keys, self._pending_refresh = self._pending_refresh, {}
+        if not keys or self.refresh(*keys):
+            return
+
+        # something saved isn't in the model any more: fall back to a full rebuild
+        cur = self.view.currentIndex()
+        self.rebuild(select_key=self.model.data(cur, ROLE_KEY) if cur.isValid() else None)
+
+    def reload_group(self, key: NodeKey) -> bool:
+        """Re-list a group's sources in place; False if the group isn't built yet."""
+        if not self.model or not key.kind.startswith("grp_"):
+            return False
+
+        idx = self._find(key)
+        if idx is None:
+            return False
+
+        # one removeRows + one appendRows, painted once
+        self.view.setUpdatesEnabled(False)
+        try:
+            self._builder.reload_group(self.model.itemFromIndex(idx))
+        finally:
+            self.view.setUpdatesEnabled(True)
+        return True
+
     def select(self, key: NodeKey) -> bool:
         if not self.model:
             return False
 
-        matches = self.model.match(
-            self.model.index(0, 0),
-            ROLE_KEY,
-            key,
-            hits=1,
-            flags=Qt.MatchFlag.MatchRecursive | Qt.MatchFlag.MatchExactly,
-        )
-        if not matches:
+        self._ensure_loaded(key)
+        idx = self._find(key)
+        if idx is None:
             return False
 
-        idx = matches[0]
-        self.view.setCurrentIndex(idx)
+        self._select_now = True
+        try:
+            self.view.setCurrentIndex(idx)
+        finally:
+            self._select_now = False
         self.view.scrollTo(idx)
         return True
 
+    def _on_expanded(self, index):
+        if not self.model:
+            return
+        self._builder.populate(self.model.itemFromIndex(index))
+
     def _on_current_changed(self, current, _previous):
         if not current.isValid() or not self.model:
             return
         key = self.model.data(current, ROLE_KEY)
-        if isinstance(key, NodeKey):
+        if not isinstance(key, NodeKey):
+            return
+
+        # clicks and select() load right away; arrow-key scrubbing only loads
+        # the editor for the row it settles on
+        if self._select_now or QApplication.mouseButtons() != Qt.MouseButton.NoButton:
+            self._select_timer.stop()
+            self._pending_key = None
+            self.nodeSelected.emit(key)
+            return
+
+        self._pending_key = key
+        self._select_timer.start()
+
+    def _emit_selected(self):
+        key, self._pending_key = self._pending_key, None
+        # the row may have gone (delete, reload) while the key was queued
+        if key is not None and self.model and self._find(key) is not None:
             self.nodeSelected.emit(key)
 
     def _on_context_menu(self, pos):
@@ -729,10 +1206,7 @@ class BaseEditor(QWidget):
         self._v.setSpacing(12)
 
         self.title = QLabel("", self)
-        fnt = self.title.font()
-        fnt.setPointSize(13)
-        fnt.setBold(True)
-        self.title.setFont(fnt)
+        self.title.setFont(_font(13, bold=True))
         self._v.addWidget(self.title)
 
         self.form = QFormLayout()
@@ -747,14 +1221,11 @@ class BaseEditor(QWidget):
     def set_title(self, text: str):
         self.title.setText(text)
 
-    def clear_buttons(self):
-        while self._btn_row.count():
-            it = self._btn_row.takeAt(0)
-            w = it.widget()
-            if w:
-                w.setParent(None)
-                w.deleteLater()
-        self._btn_row.addStretch(1)
+    def add_row(self, text: str, field: QWidget):
+        # explicit plain-text label: skips QLabel's rich-text sniffing of the caption
+        label = QLabel(text, self)
+        label.setTextFormat(Qt.TextFormat.PlainText)
+        self.form.addRow(label, field)
 
     @staticmethod
     def word_limit_ok(text: str, max_words: int) -> bool:
@@ -764,6 +1235,17 @@ class BaseEditor(QWidget):
 # Exchange editor
 # -----------------------------
 class ExchangeEditor(BaseEditor):
+    # decoded once per process; availableTimeZoneIds() returns ~600 QByteArrays
+    _tz_ids: Optional[Tuple[str, ...]] = None
+    _tz_set: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def _timezones(cls) -> Tuple[str, ...]:
+        if cls._tz_ids is None:
+            cls._tz_ids = tuple(sorted(bytes(z).decode("utf-8", "ignore") for z in QTimeZone.availableTimeZoneIds()))
+            cls._tz_set = frozenset(cls._tz_ids)
+        return cls._tz_ids
+
     def __init__(self, parent: QWidget, facade: ExchangeConfigFacade, save_config_cb):
         super().__init__(parent, facade)
         self._save_config_cb = save_config_cb
@@ -773,14 +1255,12 @@ class ExchangeEditor(BaseEditor):
         self.enabled_in = QCheckBox("Enabled", self)
 
         self.tz_in = QComboBox(self)
-        tz_ids = [bytes(z).decode("utf-8", "ignore") for z in QTimeZone.availableTimeZoneIds()]
-        tz_ids.sort()
-        self.tz_in.addItems(tz_ids)
+        self.tz_in.addItems(self._timezones())
 
-        self.form.addRow("Name", self.name_in)
-        self.form.addRow("Symbol", self.symbol_in)
-        self.form.addRow("Timezone", self.tz_in)
-        self.form.addRow("", self.enabled_in)
+        self.add_row("Name", self.name_in)
+        self.add_row("Symbol", self.symbol_in)
+        self.add_row("Timezone", self.tz_in)
+        self.add_row("", self.enabled_in)
 
         self.save_btn = QPushButton("Save exchange", self)
         self._btn_row.addWidget(self.save_btn)
@@ -796,7 +1276,7 @@ class ExchangeEditor(BaseEditor):
         self.enabled_in.setChecked(bool(ex.get("enabled", True)))
 
         cur_tz = ex.get("timezone", "UTC")
-        if self.tz_in.findText(cur_tz) >= 0:
+        if cur_tz in self._tz_set or self.tz_in.findText(cur_tz) >= 0:
             self.tz_in.setCurrentText(cur_tz)
         else:
             self.tz_in.insertItem(0, cur_tz)
@@ -812,7 +1292,7 @@ class ExchangeEditor(BaseEditor):
         ex["enabled"] = bool(self.enabled_in.isChecked())
 
         self._save_config_cb()
-        QMessageBox.information(self, "Saved", "Exchange updated.")
+        QMessageBox.information(self, "Updated", "Exchange updated; it will be written to disk shortly.")
         self.saved.emit(self._key)
 
 # -----------------------------
@@ -827,9 +1307,9 @@ class StockEditor(BaseEditor):
         self.full_name_in = QLineEdit(self)
         self.enabled_in = QCheckBox("Enabled", self)
 
-        self.form.addRow("Ticker", self.ticker_in)
-        self.form.addRow("Full name", self.full_name_in)
-        self.form.addRow("", self.enabled_in)
+        self.add_row("Ticker", self.ticker_in)
+        self.add_row("Full name", self.full_name_in)
+        self.add_row("", self.enabled_in)
 
         self.save_btn = QPushButton("Save stock", self)
         self._btn_row.addWidget(self.save_btn)
@@ -853,7 +1333,7 @@ class StockEditor(BaseEditor):
         st["enabled"] = bool(self.enabled_in.isChecked())
 
         self._save_config_cb()
-        QMessageBox.information(self, "Saved", "Stock updated.")
+        QMessageBox.information(self, "Updated", "Stock updated; it will be written to disk shortly.")
         self.saved.emit(self._key)
 
 # -----------------------------
@@ -876,20 +1356,22 @@ class NewsSourceEditor(BaseEditor):
         # Make editable so empty rss_config/apis_config doesn't block user input
         self.name_in = QComboBox(self)
         self.name_in.setEditable(True)
+        self._names_for: Optional[Tuple[str, tuple]] = None   # (type, config keys) the dropdown holds
 
         # URL row (label + field) - will be hidden when type is "api"
         self.url_label = QLabel("URL (rss)", self)
+        self.url_label.setTextFormat(Qt.TextFormat.PlainText)
         self.url_in = QLineEdit(self)
         self.url_in.setMaxLength(800)
 
         self.query_in = QLineEdit(self)
         self.query_in.setMaxLength(800)
 
-        self.form.addRow("", self.enabled_in)
-        self.form.addRow("Type", self.type_in)
-        self.form.addRow("Name (RSS/API_NAME)", self.name_in)
+        self.add_row("", self.enabled_in)
+        self.add_row("Type", self.type_in)
+        self.add_row("Name (RSS/API_NAME)", self.name_in)
         self.form.addRow(self.url_label, self.url_in)
-        self.form.addRow("Query (<=100 words)", self.query_in)
+        self.add_row("Query (<=100 words)", self.query_in)
 
         self.delete_btn = QPushButton("Delete news source", self)
         self.save_btn = QPushButton("Save news source", self)
@@ -908,8 +1390,10 @@ class NewsSourceEditor(BaseEditor):
         if key.idx is None or not (0 <= key.idx < len(lst)):
             # show empty state (keep editor usable)
             self.enabled_in.setChecked(False)
-            self.type_in.setCurrentText("rss")
+            with QSignalBlocker(self.type_in):
+                self.type_in.setCurrentText("rss")
             self.name_in.clear()
+            self._names_for = None
             self.url_in.setText("")
             self.query_in.setText("")
             self._update_url_visibility()
@@ -918,8 +1402,10 @@ class NewsSourceEditor(BaseEditor):
         src = lst[key.idx]
         self.enabled_in.setChecked(bool(src.get("enabled", True)))
 
+        # load() repopulates the dropdown itself below; don't let the type change do it too
         cur_type = (src.get("type", "rss") or "rss").strip()
-        self.type_in.setCurrentText(cur_type if cur_type in ("rss", "api") else "rss")
+        with QSignalBlocker(self.type_in):
+            self.type_in.setCurrentText(cur_type if cur_type in ("rss", "api") else "rss")
 
         self.url_in.setText(src.get("url", ""))
         self.query_in.setText(src.get("query", ""))
@@ -949,23 +1435,27 @@ class NewsSourceEditor(BaseEditor):
         self.url_in.setVisible(is_rss)
 
     def _repopulate_name_dropdown(self):
+        t = self.type_in.currentText().strip()
+        keys = tuple((self.f.apis_config if t == "api" else self.f.rss_config) or ())
+
+        # same type and same configured names as the last fill: the items are already right
+        if (t, keys) == self._names_for:
+            return
+        self._names_for = (t, keys)
+
         self.name_in.blockSignals(True)
+        self.name_in.setUpdatesEnabled(False)
         current = self.name_in.currentText()
         self.name_in.clear()
 
-        t = self.type_in.currentText().strip()
-        if t == "api":
-            names = sorted(list((self.f.apis_config or {}).keys()))
-        else:
-            names = sorted(list((self.f.rss_config or {}).keys()))
-
-        if names:
-            self.name_in.addItems(names)
+        if keys:
+            self.name_in.addItems(sorted(keys))
 
         # restore typed text in editable combo
         if current:
             self.name_in.setCurrentText(current)
 
+        self.name_in.setUpdatesEnabled(True)
         self.name_in.blockSignals(False)
 
     def _on_save(self):
@@ -997,7 +1487,7 @@ class NewsSourceEditor(BaseEditor):
         src["query"] = q
 
         self._save_config_cb()
-        QMessageBox.information(self, "Saved", "News source updated.")
+        QMessageBox.information(self, "Updated", "News source updated; it will be written to disk shortly.")
         self.saved.emit(self._key)
 
     def _on_delete(self):
@@ -1012,7 +1502,7 @@ class NewsSourceEditor(BaseEditor):
 
         self._save_config_cb()
         QMessageBox.information(self, "Deleted", "News source deleted." if ok else "This news source no longer exists.")
-        # Re-select parent group; rebuild will re-index remaining items safely.
+        # Re-select parent group; the tree re-lists (and re-indexes) the group.
         self.deleted.emit(parent)
 
 # -----------------------------
@@ -1029,9 +1519,9 @@ class DictSourceEditor(BaseEditor):
         self._kind = kind  # "social" or "fin"
 
         self.enabled_in = QCheckBox("Enabled", self)
-        self.form.addRow("", self.enabled_in)
+        self.add_row("", self.enabled_in)
 
-        self.form.addRow("Config JSON (excluding 'enabled')", QLabel("", self))
+        self.add_row("Config JSON (excluding 'enabled')", QLabel("", self))
         self.json_in = QPlainTextEdit(self)
         self.json_in.setMinimumHeight(160)
         self._v.insertWidget(3, self.json_in)  # after form; before button row
@@ -1091,7 +1581,7 @@ class DictSourceEditor(BaseEditor):
         m[name] = new_src
 
         self._save_config_cb()
-        QMessageBox.information(self, "Saved", "Source updated.")
+        QMessageBox.information(self, "Updated", "Source updated; it will be written to disk shortly.")
         self.saved.emit(self._key)
 
     def _on_delete(self):
@@ -1134,6 +1624,7 @@ class ExchangesScreen(Screen):
         self.news_editor: Optional[NewsSourceEditor] = None
         self.social_editor: Optional[DictSourceEditor] = None
         self.fin_editor: Optional[DictSourceEditor] = None
+        self._editors: Dict[str, BaseEditor] = {}   # NodeKey.kind -> editor page
 
     def setup(self, title, subtitle):
         super().setup(title, subtitle)
@@ -1181,12 +1672,17 @@ class ExchangesScreen(Screen):
         self.social_editor = DictSourceEditor(right, self.f, self._save_config, kind="social")
         self.fin_editor = DictSourceEditor(right, self.f, self._save_config, kind="fin")
 
+        self._editors = {
+            "ex": self.ex_editor,
+            "st": self.st_editor,
+            "src_news": self.news_editor,
+            "src_social": self.social_editor,
+            "src_fin": self.fin_editor,
+        }
+
         self.stack.addWidget(self.blank)
-        self.stack.addWidget(self.ex_editor)
-        self.stack.addWidget(self.st_editor)
-        self.stack.addWidget(self.news_editor)
-        self.stack.addWidget(self.social_editor)
-        self.stack.addWidget(self.fin_editor)
+        for ed in self._editors.values():
+            self.stack.addWidget(ed)
         self.stack.setCurrentWidget(self.blank)
 
         splitter.setStretchFactor(0, 0)
@@ -1196,48 +1692,36 @@ class ExchangesScreen(Screen):
         self.tree_panel.nodeSelected.connect(self._on_node_selected)
         self.tree_panel.actionRequested.connect(self._on_tree_action)
 
-        for ed in (self.ex_editor, self.st_editor, self.news_editor, self.social_editor, self.fin_editor):
+        for ed in self._editors.values():
             ed.saved.connect(self._on_editor_saved)
             ed.deleted.connect(self._on_editor_deleted)
 
     def _on_node_selected(self, key: NodeKey):
         assert self.stack is not None
         assert self.blank is not None
-        assert self.ex_editor is not None
-        assert self.st_editor is not None
-        assert self.news_editor is not None
-        assert self.social_editor is not None
-        assert self.fin_editor is not None
 
-        if key.kind == "ex":
-            self.ex_editor.load(key)
-            self.stack.setCurrentWidget(self.ex_editor)
-        elif key.kind == "st":
-            self.st_editor.load(key)
-            self.stack.setCurrentWidget(self.st_editor)
-        elif key.kind == "src_news":
-            self.news_editor.load(key)
-            self.stack.setCurrentWidget(self.news_editor)
-        elif key.kind == "src_social":
-            self.social_editor.load(key)
-            self.stack.setCurrentWidget(self.social_editor)
-        elif key.kind == "src_fin":
-            self.fin_editor.load(key)
-            self.stack.setCurrentWidget(self.fin_editor)
-        else:
+        editor = self._editors.get(key.kind)
+        if editor is None:
             # groups or unknown nodes
             self.stack.setCurrentWidget(self.blank)
+            return
+
+        editor.load(key)
+        self.stack.setCurrentWidget(editor)
 
     def _on_editor_saved(self, reselect_key: NodeKey):
         assert self.tree_panel is not None
-        self.tree_panel.rebuild(select_key=reselect_key)
+        # saves never change keys, so restyle the saved subtree instead of rebuilding the model
+        self.tree_panel.schedule_refresh(reselect_key)
 
     def _on_editor_deleted(self, reselect_key: NodeKey):
         assert self.tree_panel is not None
         assert self.stack is not None
         assert self.blank is not None
 
-        self.tree_panel.rebuild(select_key=reselect_key)
+        # deletes only ever remove sources: re-list the parent group rather than the whole tree
+        if not self.tree_panel.reload_group(reselect_key):
+            self.tree_panel.rebuild(select_key=reselect_key)
         if not self.tree_panel.select(reselect_key):
             self.stack.setCurrentWidget(self.blank)
 
@@ -1330,7 +1814,18 @@ class ExchangesScreen(Screen):
                 return
 
 
+def _default_screen(panel, s):
+    return Screen(panel.stack)
+
+
 class Panel(object):
+    # screen_key -> factory(panel, screen_dict); unknown keys fall back to a plain Screen
+    _SCREEN_FACTORIES = {
+        "Tests": lambda self, s: TestsScreen(self.stack, s["run_tests_callback"]),
+        "APIs": lambda self, s: APIScreen(self.stack, self._save_config, self.save_env, apis_config=self.config["apis"]),
+        "Exchanges": lambda self, s: ExchangesScreen(self.stack, self._save_config, exchange_config=self.config["exchanges"], apis_config=self.config["apis"]),
+    }
+
     def __init__(self, screens, config, save_config, save_env):
         super(Panel, self).__init__()
         self.screens = screens
@@ -1339,25 +1834,58 @@ class Panel(object):
         # methods
         self.save_config = save_config
         self.save_env = save_env
+        self._write_config = ConfigWriter(save_config)
 
         # Qt main window + central layout
         self.window = QMainWindow()
         self.central = QWidget(self.window)
         self.window.setCentralWidget(self.central)
 
+        # a burst of saves (several editors, APIs) collapses into one write
+        self._save_timer = QTimer(self.window)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._flush_config)
+
+        # don't lose a write still waiting on the timer when the app quits
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_pending_config)
+
         self.nav = None
         self.stack = None
 
         # screen_key -> index in stack
         self._screen_index = {}
 
+        # nav button id -> screen_key (set in _setup_nav)
+        self._nav_keys = []
+        self._nav_group = None
+
     def show_screen(self, name: str):
         if name not in self._screen_index:
             return
+        self._ensure_screen(name)
         self.stack.setCurrentIndex(self._screen_index[name])
 
+    def _on_nav_clicked(self, btn_id: int):
+        self.show_screen(self._nav_keys[btn_id])
+
     def _save_config(self):
-        self.save_config(complete_config=json.dumps(self.config, indent=3))
+        self._save_timer.start()
+
+    def _flush_config(self):
+        # runs from a timer slot: an escaping exception would abort PyQt, so report it here
+        try:
+            self._write_config(self.config)
+        except Exception as e:
+            log.exception("config write failed")
+            QMessageBox.critical(self.window, "Save failed", f"The config could not be written:\n{e}")
+
+    def _flush_pending_config(self):
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._flush_config()
 
     def _setup_nav(self, root_layout: QVBoxLayout):
         nav = QWidget(self.central)
@@ -1365,10 +1893,14 @@ class Panel(object):
         nav_l.setContentsMargins(0, 0, 0, 0)
         nav_l.setSpacing(8)
 
-        for screen_key in self.screens:
+        # one group, one slot: the button id indexes into self._nav_keys
+        self._nav_keys = list(self.screens)
+        self._nav_group = QButtonGroup(nav)
+        for i, screen_key in enumerate(self._nav_keys):
             btn = QPushButton(self.screens[screen_key]["title"], nav)
-            btn.clicked.connect(lambda _=False, key=screen_key: self.show_screen(key))
+            self._nav_group.addButton(btn, i)
             nav_l.addWidget(btn)
+        self._nav_group.idClicked.connect(self._on_nav_clicked)
 
         nav_l.addStretch(1)
         self.nav = nav
@@ -1379,21 +1911,26 @@ class Panel(object):
         root_layout.addWidget(self.stack, 1)
 
     def _setup_screens(self):
+        # screens are built on first show; until then each slot holds an empty page
         for screen_key in self.screens:
-            match screen_key:
-                case "Tests":
-                    scr = TestsScreen(self.stack, self.screens[screen_key]["run_tests_callback"])
-                case "APIs":
-                    scr = APIScreen(self.stack, self._save_config, self.save_env, apis_config=self.config["apis"])
-                case "Exchanges":
-                    scr = ExchangesScreen(self.stack, self._save_config, exchange_config=self.config["exchanges"], apis_config=self.config["apis"])
-                case _:
-                    scr = Screen(self.stack)
-
-            scr.setup(self.screens[screen_key]["title"], self.screens[screen_key]["subtitle"])
-            idx = self.stack.addWidget(scr.frame)
-            self.screens[screen_key]["screen"] = scr
-            self._screen_index[screen_key] = idx
+            self._screen_index[screen_key] = self.stack.addWidget(QWidget(self.stack))
+
+    def _ensure_screen(self, name: str):
+        s = self.screens[name]
+        if s.get("screen") is not None:
+            return
+
+        factory = self._SCREEN_FACTORIES.get(name, _default_screen)
+        scr = factory(self, s)
+        scr.setup(s["title"], s["subtitle"])
+
+        # swap the real page into the placeholder's slot, keeping _screen_index valid
+        idx = self._screen_index[name]
+        placeholder = self.stack.widget(idx)
+        self.stack.insertWidget(idx, scr.frame)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        s["screen"] = scr
 
     def setup(self):
         if self.screens is None or self.config is None:
@@ -1410,17 +1947,16 @@ class Panel(object):
         self._setup_nav(root_layout)
         self._setup_content_frame(root_layout)
 
-        if self.nav is None or self.stack is None:
-            raise Exception("Navigation and Content frame incomplete")
+        assert self.nav is not None and self.stack is not None, "Navigation and Content frame incomplete"
 
         self._setup_screens()
-        pprint.pprint(self.screens)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("screens=%s", {k: v["title"] for k, v in self.screens.items()})
 
-        all_screens = list(self.screens.keys())
-        if len(all_screens) == 0:
-            raise Exception("Screens setup incomplete")
+        if not self.screens:
+            raise RuntimeError("Screens setup incomplete")
 
-        self.show_screen(all_screens[-1])
+        self.show_screen(next(reversed(self.screens)))
 
 
 
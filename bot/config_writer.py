@@ -0,0 +1,27 @@
+import json
+import hashlib
+
+
+class ConfigWriter(object):
+    """Serializes the config and hands it to save_config, skipping unchanged payloads.
+
+    Shared by the Tk (classes) and Qt (classes1) panels. The config is encoded
+    once per save: the same string is hashed and, if it changed, written.
+    """
+
+    INDENT = 3   # the config file is hand-edited, keep it readable
+
+    def __init__(self, save_config):
+        super(ConfigWriter, self).__init__()
+        self.save_config = save_config
+        self._last_hash = None   # digest of the last payload written
+
+    def __call__(self, config: dict) -> bool:
+        payload = json.dumps(config, indent=self.INDENT)
+        h = hashlib.blake2b(payload.encode(), digest_size=8).digest()
+        if h == self._last_hash:
+            return False   # nothing changed since the last write
+
+        self.save_config(complete_config=payload)
+        self._last_hash = h
+        return True
@@ -2,6 +2,7 @@ import os
 import json
 import pprint
 import traceback
+from dotenv import set_key
 from PyQt6.QtWidgets import (
     QApplication,
 )
@@ -49,32 +50,29 @@ def save_config(filename="original_config.json", complete_config: str=None):
         config_file.write(complete_config)
 
 
-def save_env(key, value):
+def save_env(key, value, filename=".env"):
     if key is None or value is None:
         return
 
-    with open(filename, "w") as config_file:
-        config_file.write(complete_config)
+    set_key(filename, key, value)
+    os.environ[key] = value   # keep the running process in sync with the file
 
 
 
 # tests functionality ====================================================================================
 def run_tests():
-    tests_results = []
-
+    # generator: yields one result line per test
     filename, config = load_config()
-    # tests_results.append( f"config_integrity_and_loading ({filename}) -> " + is_json_valid(config) )
-    tests_results.append( "env_variables_loading -> " + check_env() )
+    # yield f"config_integrity_and_loading ({filename}) -> " + is_json_valid(config)
+    yield "env_variables_loading -> " + check_env()
 
     config = json.loads(config)
     for api_name, api_config in config["apis"].items():
         res = test_apis(api_name, api_config)
         if res:
-            tests_results.append(f"{api_name} -> {res}")
+            yield f"{api_name} -> {res}"
         else:
-            tests_results.append(f"{api_name} -> Either the test function is not set or its not working")
-
-    return tests_results
+            yield f"{api_name} -> Either the test function is not set or its not working"
 
 
 